@@ -1,28 +1,32 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
-from starlette.templating import Jinja2Templates
-from starlette.requests import Request
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Optional
 import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
 
 # Import database functions (PostgreSQL-based)
-from .database import get_brands_list, close_pool, get_connection, get_events_list
+from .database import (
+    get_brands_list, close_pool, ping_database, get_events_list,
+    start_profile_view_refresher, stop_profile_view_refresher,
+)
 from .matching import get_matches_for_brand, get_matches_for_event
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    start_profile_view_refresher()  # No-op unless USE_PROFILE_VIEWS is set
     yield
+    stop_profile_view_refresher()
     close_pool()
     print("Database connection pool closed.")
 
 
-app = FastAPI(title="Sponsorship Matching System", lifespan=lifespan)
+app = FastAPI(
+    title="Sponsorship Matching System",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # Large match payloads: orjson encoder
+)
 
 # Paths relative to project root (parent of app/)
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -31,33 +35,45 @@ templates_path = os.path.join(BASE_DIR, "templates")
 
 # Mount static files first so /static/* is served
 if os.path.isdir(static_path):
+    from fastapi.staticfiles import StaticFiles
     app.mount("/static", StaticFiles(directory=static_path), name="static")
 else:
     print("Warning: static directory not found at", static_path)
 
-templates = Jinja2Templates(directory=templates_path)
+
+@lru_cache(maxsize=1)
+def _render_index() -> str:
+    """
+    Render index.html once; it has no per-request data.
+    
+    Jinja2 is imported here, on the first page hit, to keep it off the
+    import path of API-only cold starts.
+    """
+    from starlette.templating import Jinja2Templates
+    templates = Jinja2Templates(directory=templates_path)
+    return templates.get_template("index.html").render()
 
 
 @app.get("/", response_class=HTMLResponse)
-async def read_root(request: Request):
+async def read_root():
     """Serve the main HTML page."""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return HTMLResponse(content=_render_index())
 
 
+# Database-backed routes are plain `def`: the psycopg pool is synchronous, so
+# FastAPI runs them in its threadpool instead of blocking the event loop.
 @app.get("/health")
-async def health():
+def health():
     """Health check: verifies database connectivity."""
     try:
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("SELECT 1")
+        ping_database()
         return {"status": "ok", "database": "connected"}
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"Database unavailable: {e}")
 
 
 @app.get("/api/brands")
-async def get_brands():
+def get_brands():
     """Get all brands (brands) for dropdown."""
     try:
         brands = get_brands_list()
@@ -67,7 +83,7 @@ async def get_brands():
 
 
 @app.get("/api/events")
-async def get_events():
+def get_events():
     """Get all events for dropdown."""
     try:
         events = get_events_list()
@@ -76,10 +92,10 @@ async def get_events():
         raise HTTPException(status_code=503, detail=str(e))
 
 @app.get("/api/brands/{brand_id}/matches")
-async def get_brand_matches(brand_id: int):
-    """Get matched events for a specific brand (brand)."""
+def get_brand_matches(brand_id: int, limit: Optional[int] = Query(None, ge=1)):
+    """Get matched events for a specific brand (brand); `limit` keeps the top N."""
     try:
-        result = get_matches_for_brand(brand_id)
+        result = get_matches_for_brand(brand_id, top_k=limit)
         if result is None:
             result = {"brand_org_id": brand_id, "brand_name": "Unknown", "matches": []}
         result["brand_name"] = result.get("brand_name", "Unknown")
@@ -88,10 +104,10 @@ async def get_brand_matches(brand_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/events/{event_id}/matches")
-async def get_event_matches(event_id: int):
-    """Get matched brands for a specific event."""
+def get_event_matches(event_id: int, limit: Optional[int] = Query(None, ge=1)):
+    """Get matched brands for a specific event; `limit` keeps the top N."""
     try:
-        result = get_matches_for_event(event_id)
+        result = get_matches_for_event(event_id, top_k=limit)
         if result is None:
             result = {"event_org_id": event_id, "event_name": "Unknown", "matches": []}
         return result
@@ -10,22 +10,90 @@ DESIGN PRINCIPLES:
 - Explainable: Each score includes human-readable explanation
 """
 
+import heapq
 import json
-from typing import Dict, List, Optional
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 from .database import (
     get_brand_profile,
+    get_brand_profiles_bulk,
     get_event_profile,
+    get_event_profiles_bulk,
+    get_all_brand_orgs,
     get_all_event_orgs,
     check_geographic_match,
+    is_geographic_match,
     get_match_weight_set,
     get_match_rule_set
 )
 
 
+# ============================================================================
+# MATCH CONFIGURATION DEFAULTS
+# ============================================================================
+
+# Used when a brand has no (or an inactive) weight/rule set in configdb.
+# Keys match get_match_weight_set() / get_match_rule_set().
+DEFAULT_MATCH_WEIGHTS: Dict[str, float] = {
+    'category': 0.25,
+    'geo': 0.20,
+    'budget': 0.20,
+    'audience': 0.20,
+    'deliverables': 0.15
+}
+DEFAULT_MATCH_RULES: Dict[str, Any] = {
+    'enforce_must_have_deliverables': False,
+    'enforce_city_filter': False,
+    'enforce_date_window': False,
+    'enforce_budget_overlap': False,
+    'min_budget_overlap_ratio': 1.0,
+    'allowed_date_slack_days': 0,
+    'min_audience_overlap_score': 1.0,
+    'budget_near_boundary_ratio': 0.1,
+    'footfall_partial_match_ratio': 0.8
+}
+
+
+# Ranking key for match lists (descending)
+_MATCH_SORT_KEY = itemgetter('match_percentage')
+
+
+def get_brand_match_config(brand: Dict) -> Tuple[Dict[str, float], Dict[str, Any]]:
+    """
+    Resolve a brand's (weights, rules), falling back to the defaults when its
+    configdb sets are missing or inactive.
+    
+    WHY: The configuration depends on the brand only, so batch matching
+         resolves it once per brand instead of once per pair.
+    """
+    weight_set_id = brand.get('default_match_weight_set_id')
+    rule_set_id = brand.get('default_match_rule_set_id')
+    weights = (get_match_weight_set(weight_set_id) if weight_set_id else None) or DEFAULT_MATCH_WEIGHTS
+    rules = (get_match_rule_set(rule_set_id) if rule_set_id else None) or DEFAULT_MATCH_RULES
+    return weights, rules
+
+
 # ============================================================================
 # SCORING FUNCTIONS
 # ============================================================================
 
+def _disabled_score(passed_hard_filter: bool = True) -> Dict:
+    """
+    Score for a criterion whose weight is 0 (switched off in the weight set).
+    
+    WHY: A zero weight cannot change the total, so skip the scoring work and
+         explanation formatting. Hard filters still apply: callers pass the
+         result of the cheap membership test.
+    """
+    return {
+        "weight": 0.0,
+        "match_factor": 0.0,
+        "contribution": 0.0,
+        "explanation": "(disabled)",
+        "passed_hard_filter": passed_hard_filter
+    }
+
+
 def score_geography(
     event_city_id: int,
     brand_profile: Dict,
@@ -42,6 +110,9 @@ def score_geography(
     
     WHY: Deterministic, reviewable, no approximation errors.
     """
+    if weight == 0.0:
+        return _disabled_score(bool(event_city_id) and is_geographic_match(event_city_id, brand_profile))
+    
     if not event_city_id:
         return {
             "weight": weight,
@@ -81,6 +152,9 @@ def score_budget(
     budget_near_boundary_ratio: float
 ) -> Dict:
     """Score budget match based on range overlap."""
+    if weight == 0.0:
+        return _disabled_score()
+    
     if event_funding_min is None or event_funding_max is None:
         return {
             "weight": weight,
@@ -89,7 +163,7 @@ def score_budget(
             "explanation": "Event budget not specified"
         }
     
-    # Convert Decimals to float (PostgreSQL numeric fields return Decimal)
+    # Normalize to float (loaded profiles already coalesce missing values to 0.0)
     event_funding_min = float(event_funding_min)
     event_funding_max = float(event_funding_max)
     sponsor_budget_min = float(sponsor_budget_min)
@@ -132,9 +206,8 @@ def score_budget(
 
 
 def score_categories(
-    event_categories: List[Dict],
-    preferred_categories: List[Dict],
-    avoided_categories: List[Dict],
+    event: Dict,
+    brand: Dict,
     weight: float
 ) -> Dict:
     """
@@ -144,7 +217,15 @@ def score_categories(
     - If event category in preferred → full match
     - If event category in avoided → zero match
     - Otherwise → neutral (0.5)
+    
+    Uses the id frozensets precomputed at profile load (_category_ids,
+    _preferred_cat_ids, _avoided_cat_ids).
     """
+    if weight == 0.0:
+        # Avoided categories still reject the pair
+        return _disabled_score(not (event['_category_ids'] & brand['_avoided_cat_ids']))
+    
+    event_categories = event.get('categories', [])
     if not event_categories:
         return {
             "weight": weight,
@@ -153,9 +234,9 @@ def score_categories(
             "explanation": "Event categories not specified"
         }
     
-    event_cat_ids = {c['category_id'] for c in event_categories}
-    preferred_ids = {c['category_id'] for c in preferred_categories}
-    avoided_ids = {c['category_id'] for c in avoided_categories}
+    event_cat_ids = event['_category_ids']
+    avoided_ids = brand['_avoided_cat_ids']
+    preferred_ids = brand['_preferred_cat_ids']
     
     # Check if any event category is avoided
     if event_cat_ids & avoided_ids:
@@ -164,7 +245,8 @@ def score_categories(
             "weight": weight,
             "match_factor": 0.0,
             "contribution": 0.0,
-            "explanation": f"Event has avoided categories: {', '.join(avoided_names)}"
+            "explanation": f"Event has avoided categories: {', '.join(avoided_names)}",
+            "passed_hard_filter": False
         }
     
     # Check if any event category is preferred
@@ -188,12 +270,8 @@ def score_categories(
 
 
 def score_audience_overlap(
-    event_age_distribution: List[Dict],
-    event_audience_types: List[Dict],
-    event_interest_tags: List[Dict],
-    brand_age_buckets: List[Dict],
-    brand_audience_types: List[Dict],
-    brand_interest_tags: List[Dict],
+    event: Dict,
+    brand: Dict,
     weight: float
 ) -> Dict:
     """
@@ -206,13 +284,16 @@ def score_audience_overlap(
     
     Returns weighted average of all three.
     """
+    if weight == 0.0:
+        return _disabled_score()
+    
     scores = []
     explanations = []
     
     # Age overlap
-    if brand_age_buckets and event_age_distribution:
-        brand_age_ids = {ab['age_bucket_id'] for ab in brand_age_buckets}
-        event_age_ids = {ad['age_bucket_id'] for ad in event_age_distribution}
+    brand_age_ids = brand['_age_bucket_ids']
+    event_age_ids = event['_age_bucket_ids']
+    if brand_age_ids and event_age_ids:
         overlap = brand_age_ids & event_age_ids
         
         if overlap:
@@ -223,9 +304,9 @@ def score_audience_overlap(
             explanations.append("No age bucket overlap")
     
     # Audience types overlap
-    if brand_audience_types and event_audience_types:
-        brand_type_ids = {at['audience_type_id'] for at in brand_audience_types}
-        event_type_ids = {at['audience_type_id'] for at in event_audience_types}
+    brand_type_ids = brand['_audience_type_ids']
+    event_type_ids = event['_audience_type_ids']
+    if brand_type_ids and event_type_ids:
         overlap = brand_type_ids & event_type_ids
         
         if overlap:
@@ -236,14 +317,14 @@ def score_audience_overlap(
             explanations.append("No audience type overlap")
     
     # Interest tags overlap
-    if brand_interest_tags and event_interest_tags:
-        brand_tag_ids = {it['interest_tag_id'] for it in brand_interest_tags}
-        event_tag_ids = {it['interest_tag_id'] for it in event_interest_tags}
+    brand_tag_ids = brand['_interest_tag_ids']
+    event_tag_ids = event['_interest_tag_ids']
+    if brand_tag_ids and event_tag_ids:
         overlap = brand_tag_ids & event_tag_ids
         
         if overlap:
             scores.append(1.0)
-            overlap_names = [it['tag_name'] for it in event_interest_tags if it['interest_tag_id'] in overlap]
+            overlap_names = [it['tag_name'] for it in event.get('interest_tags', []) if it['interest_tag_id'] in overlap]
             explanations.append(f"Interest tags match: {', '.join(overlap_names[:3])}")
         else:
             scores.append(0.0)
@@ -266,9 +347,8 @@ def score_audience_overlap(
 
 
 def score_deliverables(
-    event_deliverables: List[Dict],
-    wanted_deliverables: List[Dict],
-    must_have_deliverables: List[Dict],
+    event: Dict,
+    brand: Dict,
     weight: float
 ) -> Dict:
     """
@@ -278,6 +358,13 @@ def score_deliverables(
     - If brand has must_have deliverables, ALL must be offered by event (hard filter)
     - Otherwise, score based on percentage of wanted deliverables offered
     """
+    if weight == 0.0:
+        # Must-have check still applies when enforced
+        return _disabled_score(
+            bool(event['_deliverable_ids']) and brand['_must_have_deliv_ids'] <= event['_deliverable_ids']
+        )
+    
+    event_deliverables = event.get('deliverables_offered', [])
     if not event_deliverables:
         return {
             "weight": weight,
@@ -287,15 +374,15 @@ def score_deliverables(
             "passed_hard_filter": False
         }
     
-    event_deliv_ids = {d['deliverable_type_id'] for d in event_deliverables}
+    event_deliv_ids = event['_deliverable_ids']
     
     # Check must_have deliverables (hard filter)
-    if must_have_deliverables:
-        must_have_ids = {d['deliverable_type_id'] for d in must_have_deliverables}
+    must_have_ids = brand['_must_have_deliv_ids']
+    if must_have_ids:
         missing = must_have_ids - event_deliv_ids
         
         if missing:
-            missing_names = [d['deliverable_name'] for d in must_have_deliverables 
+            missing_names = [d['deliverable_name'] for d in brand.get('must_have_deliverables', [])
                            if d['deliverable_type_id'] in missing]
             return {
                 "weight": weight,
@@ -306,8 +393,8 @@ def score_deliverables(
             }
     
     # Score based on wanted deliverables
-    if wanted_deliverables:
-        wanted_ids = {d['deliverable_type_id'] for d in wanted_deliverables}
+    wanted_ids = brand['_wanted_deliv_ids']
+    if wanted_ids:
         offered = wanted_ids & event_deliv_ids
         
         if offered:
@@ -332,136 +419,145 @@ def score_deliverables(
 
 
 # ============================================================================
-# MAIN MATCHING LOGIC FOR EVENT
+# EVENT-SIDE PREFILTER
 # ============================================================================
 
-def evaluate_event_for_brands(brand_org_id: int, event_org_id: int) -> Optional[Dict]:
+def passes_event_hard_filters(brand: Dict, event: Dict, rules: Dict[str, Any]) -> bool:
     """
-    Evaluate a single event against a brand's preferences.
+    Membership-only check of the hard filters event-side scoring applies.
     
-    Returns:
-        {
-            'event_org_id': int,
-            'event_name': str,
-            'total_score': float,
-            'max_score': float,
-            'match_percentage': float,
-            'breakdown': {...},
-            'explanation': str
-        }
-        OR None if event doesn't pass hard filters
+    Same verdict as _score_pair_core(full=False): an avoided event category
+    rejects the pair, and so does a geography miss when the brand's rule set
+    enforces the city filter.
     
-    WHY: Single function to score one brand-event pair. Used by batch matching.
+    WHY: Uses only the id frozensets, so brands that cannot match skip the
+         scorers (and their explanation strings) entirely.
     """
-    # Get brand and event profiles
-    brand = get_brand_profile(brand_org_id)
-    event = get_event_profile(event_org_id)
+    if event['_category_ids'] & brand['_avoided_cat_ids']:
+        return False
+    if rules['enforce_city_filter']:
+        event_city_id = event.get('city_id')
+        return bool(event_city_id) and is_geographic_match(event_city_id, brand)
+    return True
+
+
+# ============================================================================
+# PAIR SCORING CORE
+# ============================================================================
+
+def build_explanation(breakdown: Dict[str, Dict]) -> str:
+    """
+    Human-readable summary of a breakdown (positive matches only).
     
-    if not brand or not event:
-        return None
+    Built dynamically from the breakdown - no hardcoding of criteria.
+    """
+    explanation_parts = [
+        f"{name.title()}: {score['explanation']}"
+        for name, score in breakdown.items()
+        if score['match_factor'] > 0
+    ]
+    return "\n".join(explanation_parts) if explanation_parts else "Minimal match"
+
+
+def _attach_explanations(matches: List[Dict]) -> List[Dict]:
+    """Add the 'explanation' field to matches scored with explain=False."""
+    for match in matches:
+        match['explanation'] = build_explanation(match['breakdown'])
+    return matches
+
+
+def _score_pair_core(
+    brand: Dict,
+    event: Dict,
+    weights: Dict[str, float],
+    rules: Dict[str, Any],
+    full: bool = True,
+    explain: bool = True
+) -> Optional[Dict]:
+    """
+    Score one loaded brand-event pair with a resolved configuration.
     
-    # Get match configuration (weights and rules)
-    weight_set_id = brand.get('default_match_weight_set_id')
-    rule_set_id = brand.get('default_match_rule_set_id')
+    full=True scores all five criteria (brand-side view); full=False scores
+    geography, budget and categories only (event-side view).
+    explain=False leaves out 'explanation'; batch matching adds it (see
+    _attach_explanations) only to the matches it returns.
     
-    DEFAULT_WEIGHTS = {
-        'category': 0.25,
-        'geo': 0.20,
-        'budget': 0.20,
-        'audience': 0.20,
-        'deliverables': 0.15
-    }
-    DEFAULT_RULES = {
-        'enforce_must_have_deliverables': False,
-        'enforce_city_filter': False,
-        'enforce_date_window': False,
-        'enforce_budget_overlap': False,
-        'min_budget_overlap_ratio': 1.0,
-        'allowed_date_slack_days': 0,
-        'min_audience_overlap_score': 1.0,
-        'budget_near_boundary_ratio': 0.1,
-        'footfall_partial_match_ratio': 0.8
-    }
-    # Load weights (or use defaults when missing/inactive in configdb)
-    weights = get_match_weight_set(weight_set_id) if weight_set_id else None
-    if not weights:
-        weights = DEFAULT_WEIGHTS
-    # Load rules (or use defaults when missing/inactive in configdb)
-    rules = get_match_rule_set(rule_set_id) if rule_set_id else None
-    if not rules:
-        rules = DEFAULT_RULES
-    
-    # Score geography (HARD FILTER)
+    Returns the evaluate_* result dict, or None if a hard filter rejects it.
+    """
+    # Hard filters run first (cheapest first), so rejected pairs skip the
+    # remaining scorers.
+    
+    # Score categories (HARD FILTER: avoided category rejects the pair)
+    category_score = score_categories(event, brand, weights['category'])
+    if not category_score.get('passed_hard_filter', True):
+        return None
+    
+    # Score geography (HARD FILTER when the rule set enforces it)
     geo_score = score_geography(
         event.get('city_id'),
         brand,
         weights['geo']
     )
-    
     if rules['enforce_city_filter']:
         if not geo_score.get('passed_hard_filter', False):
-            # Geography is a hard filter - reject immediately
             return None
     
+    if full:
+        # Score deliverables (HARD FILTER for must_have when enforced)
+        deliverables_score = score_deliverables(event, brand, weights['deliverables'])
+        if rules['enforce_must_have_deliverables']:
+            if not deliverables_score.get('passed_hard_filter', True):
+                return None
+    
     # Score budget
     budget_score = score_budget(
-        event.get('package_min') or 0,
-        event.get('package_max') or 0,
-        brand.get('spend_per_event_min') or 0,
-        brand.get('spend_per_event_max') or 0,
+        event['package_min'],
+        event['package_max'],
+        brand['spend_per_event_min'],
+        brand['spend_per_event_max'],
         weights['budget'],
         rules['budget_near_boundary_ratio']
     )
     
-    # Score categories
-    category_score = score_categories(
-        event.get('categories', []),
-        brand.get('preferred_categories', []),
-        brand.get('avoided_categories', []),
-        weights['category']
-    )
-    
-    # If event has avoided category, reject (hard filter)
-    if category_score['match_factor'] == 0.0 and 'avoided' in category_score['explanation']:
-        return None
-    
-    # Build breakdown
+    # Build breakdown (fixed criterion order in the response)
     breakdown = {
         "geography": geo_score,
         "budget": budget_score,
         "categories": category_score
     }
+    if full:
+        # Score audience overlap (soft criterion, last)
+        breakdown["audience"] = score_audience_overlap(event, brand, weights['audience'])
+        breakdown["deliverables"] = deliverables_score
     
     # Calculate final score (dynamically from breakdown - no hardcoding)
-    total_score = sum(score['contribution'] for score in breakdown.values())
-    max_score = sum(score['weight'] for score in breakdown.values())
+    total_score = 0.0
+    max_score = 0.0
+    for score in breakdown.values():
+        total_score += score['contribution']
+        max_score += score['weight']
     match_percentage = (total_score / max_score * 100) if max_score > 0 else 0.0
     
-    # Build explanation (only include positive matches)
-    explanation_parts = []
-    for name, score in breakdown.items():
-        if score['match_factor'] > 0:
-            explanation_parts.append(f"{name.title()}: {score['explanation']}")
-    
-    explanation = "\n".join(explanation_parts) if explanation_parts else "Minimal match"
-    
-    return {
+    result = {
         "event_org_id": event['event_org_id'],
         "event_name": event['event_name'],
         "total_score": round(total_score, 2),
         "max_score": round(max_score, 2),
         "match_percentage": round(match_percentage, 2),
-        "breakdown": breakdown,
-        "explanation": explanation
+        "breakdown": breakdown
     }
+    if explain:
+        result["explanation"] = build_explanation(breakdown)
+    return result
+
 
 # ============================================================================
-# MAIN MATCHING LOGIC FOR BRANDS
+# MAIN MATCHING LOGIC FOR EVENT
 # ============================================================================
 
-def evaluate_brand_for_events(brand_org_id: int, event_org_id: int) -> Optional[Dict]:
+def evaluate_event_for_brands(brand_org_id: int, event_org_id: int) -> Optional[Dict]:
     """
-    Evaluate a single brand against events preferences.
+    Evaluate a single event against a brand's preferences.
     
     Returns:
         {
@@ -484,132 +580,101 @@ def evaluate_brand_for_events(brand_org_id: int, event_org_id: int) -> Optional[
     if not brand or not event:
         return None
     
-    # Get match configuration (weights and rules)
-    weight_set_id = brand.get('default_match_weight_set_id')
-    rule_set_id = brand.get('default_match_rule_set_id')
-    
-    DEFAULT_WEIGHTS = {
-        'category': 0.25,
-        'geo': 0.20,
-        'budget': 0.20,
-        'audience': 0.20,
-        'deliverables': 0.15
-    }
-    DEFAULT_RULES = {
-        'enforce_must_have_deliverables': False,
-        'enforce_city_filter': False,
-        'enforce_date_window': False,
-        'enforce_budget_overlap': False,
-        'min_budget_overlap_ratio': 1.0,
-        'allowed_date_slack_days': 0,
-        'min_audience_overlap_score': 1.0,
-        'budget_near_boundary_ratio': 0.1,
-        'footfall_partial_match_ratio': 0.8
-    }
-    # Load weights (or use defaults when missing/inactive in configdb)
-    weights = get_match_weight_set(weight_set_id) if weight_set_id else None
-    if not weights:
-        weights = DEFAULT_WEIGHTS
-    # Load rules (or use defaults when missing/inactive in configdb)
-    rules = get_match_rule_set(rule_set_id) if rule_set_id else None
-    if not rules:
-        rules = DEFAULT_RULES
-    
-    # Score geography (HARD FILTER)
-    geo_score = score_geography(
-        event.get('city_id'),
-        brand,
-        weights['geo']
-    )
+    return evaluate_event_for_brand_profiles(brand, event)
 
-    if rules['enforce_city_filter']:
-        if not geo_score.get('passed_hard_filter', False):
-            # Geography is a hard filter - reject immediately
-            return None
 
+def evaluate_event_for_brand_profiles(
+    brand: Dict,
+    event: Dict,
+    weights: Optional[Dict[str, float]] = None,
+    rules: Optional[Dict[str, Any]] = None,
+    explain: bool = True
+) -> Optional[Dict]:
+    """
+    Same as evaluate_event_for_brands(), for already-loaded profiles.
     
-    # Score budget
-    budget_score = score_budget(
-        event.get('package_min') or 0,
-        event.get('package_max') or 0,
-        brand.get('spend_per_event_min') or 0,
-        brand.get('spend_per_event_max') or 0,
-        weights['budget'],
-        rules['budget_near_boundary_ratio']
-    )
+    weights/rules: the brand's match configuration, if already resolved
+    (see get_brand_match_config); looked up otherwise.
+    explain: False skips building 'explanation' (see _score_pair_core).
     
-    # Score categories
-    category_score = score_categories(
-        event.get('categories', []),
-        brand.get('preferred_categories', []),
-        brand.get('avoided_categories', []),
-        weights['category']
-    )
+    WHY: Batch matching bulk-loads profiles; scoring must not refetch them.
+    """
+    # Get match configuration (weights and rules), unless resolved by the caller
+    if weights is None or rules is None:
+        weights, rules = get_brand_match_config(brand)
     
-    # If event has avoided category, reject (hard filter)
-    if category_score['match_factor'] == 0.0 and 'avoided' in category_score['explanation']:
-        return None
+    return _score_pair_core(brand, event, weights, rules, full=False, explain=explain)
+
+
+# ============================================================================
+# MAIN MATCHING LOGIC FOR BRANDS
+# ============================================================================
+
+def evaluate_brand_for_events(brand_org_id: int, event_org_id: int) -> Optional[Dict]:
+    """
+    Evaluate a single brand against events preferences.
     
-    # Score audience overlap
-    audience_score = score_audience_overlap(
-        event.get('age_distribution', []),
-        event.get('audience_types', []),
-        event.get('interest_tags', []),
-        brand.get('target_age_buckets', []),
-        brand.get('target_audience_types', []),
-        brand.get('target_interest_tags', []),
-        weights['audience']
-    )
+    Returns:
+        {
+            'event_org_id': int,
+            'event_name': str,
+            'total_score': float,
+            'max_score': float,
+            'match_percentage': float,
+            'breakdown': {...},
+            'explanation': str
+        }
+        OR None if event doesn't pass hard filters
     
-    # Score deliverables (HARD FILTER for must_have)
-    deliverables_score = score_deliverables(
-        event.get('deliverables_offered', []),
-        brand.get('wanted_deliverables', []),
-        brand.get('must_have_deliverables', []),
-        weights['deliverables']
-    )
+    WHY: Single function to score one brand-event pair. Used by batch matching.
+    """
+    # Get brand and event profiles
+    brand = get_brand_profile(brand_org_id)
+    event = get_event_profile(event_org_id)
     
-    if rules['enforce_must_have_deliverables']:
-        if not deliverables_score.get('passed_hard_filter', True):
-            # Must-have deliverables not met
-            return None
+    if not brand or not event:
+        return None
     
-    # Build breakdown
-    breakdown = {
-        "geography": geo_score,
-        "budget": budget_score,
-        "categories": category_score,
-        "audience": audience_score,
-        "deliverables": deliverables_score
-    }
+    return evaluate_brand_for_event_profiles(brand, event)
+
+
+def evaluate_brand_for_event_profiles(
+    brand: Dict,
+    event: Dict,
+    weights: Optional[Dict[str, float]] = None,
+    rules: Optional[Dict[str, Any]] = None
+) -> Optional[Dict]:
+    """
+    Same as evaluate_brand_for_events(), for already-loaded profiles.
     
-    # Calculate final score (dynamically from breakdown - no hardcoding)
-    total_score = sum(score['contribution'] for score in breakdown.values())
-    max_score = sum(score['weight'] for score in breakdown.values())
-    match_percentage = (total_score / max_score * 100) if max_score > 0 else 0.0
+    weights/rules: the brand's match configuration, if already resolved
+    (see get_brand_match_config); looked up otherwise.
     
-    # Build explanation (only include positive matches)
-    explanation_parts = []
-    for name, score in breakdown.items():
-        if score['match_factor'] > 0:
-            explanation_parts.append(f"{name.title()}: {score['explanation']}")
+    WHY: Batch matching bulk-loads profiles; scoring must not refetch them.
+    """
+    # Get match configuration (weights and rules), unless resolved by the caller
+    if weights is None or rules is None:
+        weights, rules = get_brand_match_config(brand)
     
-    explanation = "\n".join(explanation_parts) if explanation_parts else "Minimal match"
+    return _score_pair_core(brand, event, weights, rules, full=True)
+
+
+def _rank_matches(matches: List[Dict], top_k: Optional[int]) -> List[Dict]:
+    """
+    Order matches by match_percentage descending, keeping only top_k if given.
     
-    return {
-        "event_org_id": event['event_org_id'],
-        "event_name": event['event_name'],
-        "total_score": round(total_score, 2),
-        "max_score": round(max_score, 2),
-        "match_percentage": round(match_percentage, 2),
-        "breakdown": breakdown,
-        "explanation": explanation
-    }
+    WHY: heapq.nlargest is O(N log K) and stable, so a top_k list is exactly
+         the head of the full sort.
+    """
+    if top_k is not None and top_k < len(matches):
+        return heapq.nlargest(top_k, matches, key=_MATCH_SORT_KEY)
+    matches.sort(key=_MATCH_SORT_KEY, reverse=True)
+    return matches
 
 
-def get_matches_for_brand(brand_org_id: int) -> Dict:
+def get_matches_for_brand(brand_org_id: int, top_k: Optional[int] = None) -> Dict:
     """
-    Get all matched events for a brand.
+    Get all matched events for a brand (or only the best top_k).
     
     Returns:
         {
@@ -628,16 +693,26 @@ def get_matches_for_brand(brand_org_id: int) -> Dict:
             "matches": []
         }
     
-    event_org_ids = get_all_event_orgs()
-    matches = []
+    # Match configuration is per brand: resolve once for all events
+    weights, rules = get_brand_match_config(brand)
     
-    for event_org_id in event_org_ids:
-        match_result = evaluate_brand_for_events(brand_org_id, event_org_id)
+    # Brand-level hard filters run in SQL; scoring re-checks them per pair
+    event_org_ids = get_all_event_orgs(
+        brand,
+        enforce_city_filter=rules['enforce_city_filter'],
+        enforce_must_have_deliverables=rules['enforce_must_have_deliverables']
+    )
+    
+    # One bulk query for all event profiles (not one per event)
+    events = get_event_profiles_bulk(event_org_ids)
+    matches = []
+    for event in events.values():
+        match_result = _score_pair_core(brand, event, weights, rules, full=True, explain=False)
         if match_result:
             matches.append(match_result)
     
-    # Sort by match_percentage descending
-    matches.sort(key=lambda x: x['match_percentage'], reverse=True)
+    # Explanations are only built for the matches actually returned
+    matches = _attach_explanations(_rank_matches(matches, top_k))
     
     return {
         "brand_org_id": brand['brand_org_id'],
@@ -646,9 +721,9 @@ def get_matches_for_brand(brand_org_id: int) -> Dict:
     }
 
 
-def get_matches_for_event(event_org_id: int) -> Dict:
+def get_matches_for_event(event_org_id: int, top_k: Optional[int] = None) -> Dict:
     """
-    Get all matched brands for an event.
+    Get all matched brands for an event (or only the best top_k).
     
     Returns:
         {
@@ -667,17 +742,17 @@ def get_matches_for_event(event_org_id: int) -> Dict:
             "matches": []
         }
     
-    from .database import get_all_brand_orgs
-    brand_org_ids = get_all_brand_orgs()
+    # All brand profiles in one bulk query (brands without a profile are omitted)
+    brands = get_brand_profiles_bulk(get_all_brand_orgs())
     matches = []
     
-    for brand_org_id in brand_org_ids:
-        match_result = evaluate_event_for_brands(brand_org_id, event_org_id)
+    for brand_org_id, brand in brands.items():
+        weights, rules = get_brand_match_config(brand)
+        # Brands failing the geography / avoided-category hard filters skip scoring
+        if not passes_event_hard_filters(brand, event, rules):
+            continue
+        match_result = evaluate_event_for_brand_profiles(brand, event, weights, rules, explain=False)
         if match_result:
-            # Add brand info to result (guard in case brand was removed between evaluate and fetch)
-            brand = get_brand_profile(brand_org_id)
-            if not brand:
-                continue
             # Build match item for event-side view: brand + scores only (no repeated event_*)
             matches.append({
                 'brand_org_id': brand_org_id,
@@ -686,11 +761,10 @@ def get_matches_for_event(event_org_id: int) -> Dict:
                 'max_score': match_result['max_score'],
                 'match_percentage': match_result['match_percentage'],
                 'breakdown': match_result['breakdown'],
-                'explanation': match_result['explanation'],
             })
     
-    # Sort by match_percentage descending
-    matches.sort(key=lambda x: x['match_percentage'], reverse=True)
+    # Explanations are only built for the matches actually returned
+    matches = _attach_explanations(_rank_matches(matches, top_k))
     
     return {
         "event_org_id": event['event_org_id'],
@@ -11,7 +11,9 @@ IMPORTANT: Run this AFTER executing sql/matchmaking_schema_review.sql
 ConfigDB reference data (except match weight/rule sets) must already exist in the database.
 """
 
-from .database import get_connection, ConfigDB, CoreDB
+from .database import get_connection, ConfigDB, CoreDB, USE_PROFILE_VIEWS, refresh_profile_views
+from psycopg.rows import tuple_row
+from datetime import date
 from typing import Dict, List, Tuple
 import sys
 
@@ -444,7 +446,28 @@ import sys
 # LOAD CONFIGDB REFERENCE DATA (read-only; do not insert except weight/rule sets)
 # ============================================================================
 
-def load_configdb_reference_maps() -> Tuple[
+# (map tag, table, id column, name column) for each configdb reference map,
+# in the order load_configdb_reference_maps() returns them.
+REFERENCE_MAP_SPECS: List[Tuple[str, str, str, str]] = [
+    ("country", ConfigDB.COUNTRIES, "country_id", "country_name"),
+    ("state", ConfigDB.STATES, "state_id", "state_name"),
+    ("city", ConfigDB.CITIES, "city_id", "city_name"),
+    ("event_type", ConfigDB.EVENT_TYPES, "event_type_id", "event_type_name"),
+    ("category", ConfigDB.EVENT_CATEGORIES, "category_id", "category_name"),
+    ("deliverable", ConfigDB.DELIVERABLE_TYPES, "deliverable_type_id", "deliverable_name"),
+    ("age_bucket", ConfigDB.AUDIENCE_AGE_BUCKETS, "age_bucket_id", "bucket_label"),
+    ("audience_type", ConfigDB.AUDIENCE_TYPES, "audience_type_id", "type_name"),
+    ("interest_tag", ConfigDB.INTEREST_TAGS, "interest_tag_id", "tag_name"),
+]
+
+# One UNION ALL query returning (tag, name, id) rows for every map.
+REFERENCE_MAPS_SQL = " UNION ALL ".join(
+    f"SELECT '{tag}' AS tag, {name_col}::text AS name, {id_col}::int AS id FROM {table}"
+    for tag, table, id_col, name_col in REFERENCE_MAP_SPECS
+)
+
+
+def load_configdb_reference_maps(cur) -> Tuple[
     Dict[str, int], Dict[str, int], Dict[str, int],
     Dict[str, int], Dict[str, int], Dict[str, int],
     Dict[str, int], Dict[str, int], Dict[str, int]
@@ -456,54 +479,22 @@ def load_configdb_reference_maps() -> Tuple[
         (country_map, state_map, city_map, event_type_map, category_map,
          deliverable_map, age_bucket_map, audience_type_map, interest_tag_map)
     Maps use name/label as key -> id as value (e.g. country_name -> country_id).
+    
+    WHY: All nine tables are read in a single UNION ALL query (one round-trip
+         instead of nine), then rows are dispatched to their map by tag.
+         Tuple rows: no per-row dict for thousands of cities.
     """
-    country_map: Dict[str, int] = {}
-    state_map: Dict[str, int] = {}
-    city_map: Dict[str, int] = {}
-    event_type_map: Dict[str, int] = {}
-    category_map: Dict[str, int] = {}
-    deliverable_map: Dict[str, int] = {}
-    age_bucket_map: Dict[str, int] = {}
-    audience_type_map: Dict[str, int] = {}
-    interest_tag_map: Dict[str, int] = {}
-
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(f"SELECT country_id, country_name FROM {ConfigDB.COUNTRIES}")
-            for row in cur.fetchall():
-                country_map[row["country_name"]] = row["country_id"]
-
-            cur.execute(f"SELECT state_id, state_name FROM {ConfigDB.STATES}")
-            for row in cur.fetchall():
-                state_map[row["state_name"]] = row["state_id"]
-
-            cur.execute(f"SELECT city_id, city_name FROM {ConfigDB.CITIES}")
-            for row in cur.fetchall():
-                city_map[row["city_name"]] = row["city_id"]
-
-            cur.execute(f"SELECT event_type_id, event_type_name FROM {ConfigDB.EVENT_TYPES}")
-            for row in cur.fetchall():
-                event_type_map[row["event_type_name"]] = row["event_type_id"]
-
-            cur.execute(f"SELECT category_id, category_name FROM {ConfigDB.EVENT_CATEGORIES}")
-            for row in cur.fetchall():
-                category_map[row["category_name"]] = row["category_id"]
-
-            cur.execute(f"SELECT deliverable_type_id, deliverable_name FROM {ConfigDB.DELIVERABLE_TYPES}")
-            for row in cur.fetchall():
-                deliverable_map[row["deliverable_name"]] = row["deliverable_type_id"]
+    maps: Dict[str, Dict[str, int]] = {tag: {} for tag, _, _, _ in REFERENCE_MAP_SPECS}
 
-            cur.execute(f"SELECT age_bucket_id, bucket_label FROM {ConfigDB.AUDIENCE_AGE_BUCKETS}")
-            for row in cur.fetchall():
-                age_bucket_map[row["bucket_label"]] = row["age_bucket_id"]
+    with cur.connection.cursor(row_factory=tuple_row) as ref_cur:
+        ref_cur.execute(REFERENCE_MAPS_SQL)
+        for tag, name, ref_id in ref_cur:
+            maps[tag][name] = ref_id
 
-            cur.execute(f"SELECT audience_type_id, type_name FROM {ConfigDB.AUDIENCE_TYPES}")
-            for row in cur.fetchall():
-                audience_type_map[row["type_name"]] = row["audience_type_id"]
-
-            cur.execute(f"SELECT interest_tag_id, tag_name FROM {ConfigDB.INTEREST_TAGS}")
-            for row in cur.fetchall():
-                interest_tag_map[row["tag_name"]] = row["interest_tag_id"]
+    (
+        country_map, state_map, city_map, event_type_map, category_map,
+        deliverable_map, age_bucket_map, audience_type_map, interest_tag_map,
+    ) = (maps[tag] for tag, _, _, _ in REFERENCE_MAP_SPECS)
 
     print(f"✅ Loaded configdb reference maps: "
           f"countries={len(country_map)}, states={len(state_map)}, cities={len(city_map)}, "
@@ -516,8 +507,31 @@ def load_configdb_reference_maps() -> Tuple[
     )
 
 
-def seed_match_weight_sets() -> Dict[str, int]:
-    """Seed match weight sets reference table."""
+def _insert_match_sets(cur, table: str, id_column: str,
+                       columns: List[str], rows: List[Tuple]) -> Dict[str, int]:
+    """
+    Insert match weight/rule set rows (set_name, set_code at index 1, 2).
+    
+    Returns: Dict mapping set_name -> id, for new and already existing rows.
+    
+    WHY: One multi-row INSERT ... RETURNING for all rows. DO NOTHING would
+         return nothing for existing rows; the no-op DO UPDATE (set_code to
+         itself, existing values kept) makes RETURNING cover them too.
+    """
+    row_placeholder = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    cur.execute(f"""
+        INSERT INTO {table} ({", ".join(columns)})
+        VALUES {", ".join([row_placeholder] * len(rows))}
+        ON CONFLICT (set_code) DO UPDATE SET set_code = EXCLUDED.set_code
+        RETURNING {id_column}, set_code
+    """, [value for row in rows for value in row])
+    ids_by_code = {row['set_code']: row[id_column] for row in cur.fetchall()}
+    
+    return {row[1]: ids_by_code[row[2]] for row in rows}
+
+
+def seed_match_weight_sets(cur) -> Dict[str, int]:
+    """Seed match weight sets reference table (caller commits)."""
     # (match_weight_set_id, set_name, set_code, weight_category, weight_geo, weight_budget, weight_audience, weight_deliverables)
     weight_sets_data = [
         (100, "Balanced", "BALANCED", 0.25, 0.20, 0.20, 0.20, 0.15),
@@ -527,33 +541,19 @@ def seed_match_weight_sets() -> Dict[str, int]:
         (104, "Conservative", "CONSERVATIVE", 0.25, 0.25, 0.25, 0.15, 0.10),
     ]
     
-    weight_map = {}
-    
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            for set_id, set_name, set_code, w_cat, w_geo, w_bud, w_aud, w_deliv in weight_sets_data:
-                cur.execute(f"""
-                    INSERT INTO {ConfigDB.MATCH_WEIGHT_SETS} 
-                    (match_weight_set_id, set_name, set_code, weight_category, weight_geo, weight_budget, weight_audience, weight_deliverables)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (set_code) DO NOTHING
-                    RETURNING match_weight_set_id
-                """, (set_id, set_name, set_code, w_cat, w_geo, w_bud, w_aud, w_deliv))
-                result = cur.fetchone()
-                if result:
-                    weight_map[set_name] = result['match_weight_set_id']
-                else:
-                    cur.execute(f"SELECT match_weight_set_id FROM {ConfigDB.MATCH_WEIGHT_SETS} WHERE set_code = %s", (set_code,))
-                    weight_map[set_name] = cur.fetchone()['match_weight_set_id']
-            
-            conn.commit()
+    weight_map = _insert_match_sets(
+        cur, ConfigDB.MATCH_WEIGHT_SETS, "match_weight_set_id",
+        ["match_weight_set_id", "set_name", "set_code", "weight_category", "weight_geo",
+         "weight_budget", "weight_audience", "weight_deliverables"],
+        weight_sets_data
+    )
     
     print(f"✅ Seeded {len(weight_sets_data)} match weight sets")
     return weight_map
 
 
-def seed_match_rule_sets() -> Dict[str, int]:
-    """Seed match rule sets reference table."""
+def seed_match_rule_sets(cur) -> Dict[str, int]:
+    """Seed match rule sets reference table (caller commits)."""
     # (match_rule_set_id, set_name, set_code, enforce_must_have_deliverables, enforce_city_filter,
     #  enforce_date_window, enforce_budget_overlap, min_budget_overlap_ratio,
     #  allowed_date_slack_days, min_audience_overlap_score)
@@ -564,29 +564,13 @@ def seed_match_rule_sets() -> Dict[str, int]:
         (103, "Geography Strict", "GEO_STRICT", True, True, False, True, 0.10, 14, 0.20),
     ]
     
-    rule_map = {}
-    
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            for rule_data in rule_sets_data:
-                set_id, set_name, set_code = rule_data[0], rule_data[1], rule_data[2]
-                cur.execute(f"""
-                    INSERT INTO {ConfigDB.MATCH_RULE_SETS}
-                    (match_rule_set_id, set_name, set_code, enforce_must_have_deliverables, enforce_city_filter,
-                     enforce_date_window, enforce_budget_overlap, min_budget_overlap_ratio,
-                     allowed_date_slack_days, min_audience_overlap_score)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (set_code) DO NOTHING
-                    RETURNING match_rule_set_id
-                """, rule_data)
-                result = cur.fetchone()
-                if result:
-                    rule_map[set_name] = result['match_rule_set_id']
-                else:
-                    cur.execute(f"SELECT match_rule_set_id FROM {ConfigDB.MATCH_RULE_SETS} WHERE set_code = %s", (set_code,))
-                    rule_map[set_name] = cur.fetchone()['match_rule_set_id']
-            
-            conn.commit()
+    rule_map = _insert_match_sets(
+        cur, ConfigDB.MATCH_RULE_SETS, "match_rule_set_id",
+        ["match_rule_set_id", "set_name", "set_code", "enforce_must_have_deliverables",
+         "enforce_city_filter", "enforce_date_window", "enforce_budget_overlap",
+         "min_budget_overlap_ratio", "allowed_date_slack_days", "min_audience_overlap_score"],
+        rule_sets_data
+    )
     
     print(f"✅ Seeded {len(rule_sets_data)} match rule sets")
     return rule_map
@@ -596,262 +580,224 @@ def seed_match_rule_sets() -> Dict[str, int]:
 # SECTION 2: COREDB SAMPLE DATA - BRANDS
 # ============================================================================
 
-def seed_sample_brands(city_map: Dict[str, int], state_map: Dict[str, int], 
+# Insert statements are built once at import; identical strings across calls
+# also let psycopg reuse its prepared statements.
+
+# OVERRIDING SYSTEM VALUE required if org_id is IDENTITY GENERATED ALWAYS
+INSERT_ORG_SQL = f"""
+    INSERT INTO {CoreDB.ORGS} (org_id, org_type, org_name, is_active)
+    OVERRIDING SYSTEM VALUE
+    VALUES (%s, %s, %s, %s)
+    ON CONFLICT (org_id) DO NOTHING
+"""
+
+INSERT_BRAND_PROFILE_SQL = f"""
+    INSERT INTO {CoreDB.BRAND_PROFILES}
+    (brand_org_id, objective_primary, spend_per_event_min, spend_per_event_max,
+     geographic_focus_type, campaign_start, campaign_end, default_match_weight_set_id, default_match_rule_set_id)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (brand_org_id) DO NOTHING
+"""
+
+INSERT_BRAND_TARGET_CITY_SQL = f"""
+    INSERT INTO {CoreDB.BRAND_TARGET_CITIES} (brand_org_id, city_id, is_active)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (brand_org_id, city_id) DO NOTHING
+"""
+
+INSERT_BRAND_TARGET_STATE_SQL = f"""
+    INSERT INTO {CoreDB.BRAND_TARGET_STATES} (brand_org_id, state_id, is_active)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (brand_org_id, state_id) DO NOTHING
+"""
+
+INSERT_BRAND_TARGET_COUNTRY_SQL = f"""
+    INSERT INTO {CoreDB.BRAND_TARGET_COUNTRIES} (brand_org_id, country_id, is_active)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (brand_org_id, country_id) DO NOTHING
+"""
+
+INSERT_BRAND_CATEGORY_SQL = f"""
+    INSERT INTO {CoreDB.BRAND_PREFERRED_CATEGORIES}
+    (brand_org_id, category_id, preference_type)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (brand_org_id, category_id, preference_type) DO NOTHING
+"""
+
+INSERT_BRAND_DELIVERABLE_SQL = f"""
+    INSERT INTO {CoreDB.BRAND_DELIVERABLE_PREFERENCES}
+    (brand_org_id, deliverable_type_id, preference_type)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (brand_org_id, deliverable_type_id, preference_type) DO NOTHING
+"""
+
+INSERT_BRAND_AGE_BUCKET_SQL = f"""
+    INSERT INTO {CoreDB.BRAND_TARGET_AGE_BUCKETS} (brand_org_id, age_bucket_id)
+    VALUES (%s, %s)
+    ON CONFLICT (brand_org_id, age_bucket_id) DO NOTHING
+"""
+
+INSERT_BRAND_AUDIENCE_TYPE_SQL = f"""
+    INSERT INTO {CoreDB.BRAND_TARGET_AUDIENCE_TYPES} (brand_org_id, audience_type_id)
+    VALUES (%s, %s)
+    ON CONFLICT (brand_org_id, audience_type_id) DO NOTHING
+"""
+
+INSERT_BRAND_INTEREST_TAG_SQL = f"""
+    INSERT INTO {CoreDB.BRAND_TARGET_INTEREST_TAGS} (brand_org_id, interest_tag_id)
+    VALUES (%s, %s)
+    ON CONFLICT (brand_org_id, interest_tag_id) DO NOTHING
+"""
+
+
+def seed_sample_brands(cur, city_map: Dict[str, int], state_map: Dict[str, int], 
                        country_map: Dict[str, int], category_map: Dict[str, int],
                        deliverable_map: Dict[str, int], age_bucket_map: Dict[str, int],
                        audience_type_map: Dict[str, int], interest_tag_map: Dict[str, int],
                        weight_set_map: Dict[str, int], rule_set_map: Dict[str, int]) -> List[int]:
     """
-    Seed sample brand organizations with profiles and preferences.
+    Seed sample brand organizations with profiles and preferences (caller commits).
     
     Returns: List of brand_org_ids created
     """
     
-    # Brand 1: TechCorp India (LOCAL focus - Mumbai)
-    brand_1_org_id = 201
-    
-    # Brand 2: MusicCo California (STATE focus - California)
-    brand_2_org_id = 202
-    
-    # Brand 3: GlobalBrand USA (NATIONAL focus - United States)
-    brand_3_org_id = 203
+    brands_to_create = [
+        {
+            # TechCorp India (LOCAL focus - Mumbai)
+            'org_id': 201,
+            'org_name': 'TechCorp India',
+            'objective_primary': 'awareness',
+            'spend_per_event_min': 75000,
+            'spend_per_event_max': 200000,
+            'geographic_focus_type': 'local',
+            'campaign_start': date(2025, 1, 1),
+            'campaign_end': date(2025, 12, 31),
+            'match_weight_set_id': 100,
+            'match_rule_set_id': 100,
+            'target_cities': ['Mumbai', 'Pune'],
+            'preferred_categories': ['Technology', 'Business'],
+            'wanted_deliverables': ['Stage Branding', 'Social Media Posts', 'Speaking Slot'],
+            'age_buckets': ['25-34', '35-44'],
+            'audience_types': ['B2B', 'Professionals'],
+            'interest_tags': ['Technology', 'Innovation', 'AI & Machine Learning'],
+        },
+        {
+            # MusicCo California (STATE focus - California)
+            'org_id': 202,
+            'org_name': 'MusicCo California',
+            'objective_primary': 'awareness',
+            'spend_per_event_min': 25000,
+            'spend_per_event_max': 100000,
+            'geographic_focus_type': 'state',
+            'campaign_start': date(2025, 6, 1),
+            'campaign_end': date(2025, 8, 31),
+            'match_weight_set_id': 101,
+            'match_rule_set_id': 101,
+            'target_states': ['California'],
+            'preferred_categories': ['Music', 'Entertainment', 'Cultural'],
+            'wanted_deliverables': ['Social Media Posts', 'Event App Branding'],
+        },
+        {
+            # GlobalBrand USA (NATIONAL focus - United States)
+            'org_id': 203,
+            'org_name': 'GlobalBrand USA',
+            'objective_primary': 'awareness',
+            'spend_per_event_min': 50000,
+            'spend_per_event_max': 250000,
+            'geographic_focus_type': 'national',
+            'campaign_start': date(2025, 3, 1),
+            'campaign_end': date(2025, 11, 30),
+            'match_weight_set_id': 102,
+            'match_rule_set_id': 102,
+            'target_countries': ['United States'],
+            'preferred_categories': ['Technology', 'Business'],
+            'must_have_deliverables': ['Stage Branding', 'Social Media Posts'],  # strict requirement
+        },
+        {
+            # LocalChicago (LOCAL focus - Chicago area)
+            'org_id': 204,
+            'org_name': 'LocalChicago Community Fund',
+            'objective_primary': 'awareness',
+            'spend_per_event_min': 5000,
+            'spend_per_event_max': 25000,
+            'geographic_focus_type': 'local',
+            'campaign_start': None,
+            'campaign_end': None,
+            'match_weight_set_id': 103,
+            'match_rule_set_id': 103,
+            'target_cities': ['Chicago', 'Evanston', 'Aurora'],
+            'preferred_categories': ['Community', 'Cultural'],
+        },
+    ]
     
-    # Brand 4: LocalChicago (LOCAL focus - Chicago area)
-    brand_4_org_id = 204
+    # Rows are collected across all brands, then written with one executemany
+    # per table (pipelined by psycopg) instead of one INSERT each.
+    org_rows: List[Tuple] = []
+    profile_rows: List[Tuple] = []
+    target_city_rows: List[Tuple] = []
+    target_state_rows: List[Tuple] = []
+    target_country_rows: List[Tuple] = []
+    category_rows: List[Tuple] = []
+    deliverable_rows: List[Tuple] = []
+    age_bucket_rows: List[Tuple] = []
+    audience_type_rows: List[Tuple] = []
+    interest_tag_rows: List[Tuple] = []
+    
+    # (brand field, reference map, target rows, trailing column values)
+    preference_specs = [
+        ('target_cities', city_map, target_city_rows, (True,)),
+        ('target_states', state_map, target_state_rows, (True,)),
+        ('target_countries', country_map, target_country_rows, (True,)),
+        ('preferred_categories', category_map, category_rows, ('preferred',)),
+        ('wanted_deliverables', deliverable_map, deliverable_rows, ('wanted',)),
+        ('must_have_deliverables', deliverable_map, deliverable_rows, ('must_have',)),
+        ('age_buckets', age_bucket_map, age_bucket_rows, ()),
+        ('audience_types', audience_type_map, audience_type_rows, ()),
+        ('interest_tags', interest_tag_map, interest_tag_rows, ()),
+    ]
     
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            
-            # ================================================================
-            # BRAND 1: TechCorp India (LOCAL - Mumbai)
-            # ================================================================
-            
-            # Create org (OVERRIDING SYSTEM VALUE required if org_id is IDENTITY GENERATED ALWAYS)
-            cur.execute(f"""
-                INSERT INTO {CoreDB.ORGS} (org_id, org_type, org_name, is_active)
-                OVERRIDING SYSTEM VALUE
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (org_id) DO NOTHING
-            """, (brand_1_org_id, 'brand', 'TechCorp India', True))
-            
-            # Create brand profile (LOCAL focus)
-            cur.execute(f"""
-                INSERT INTO {CoreDB.BRAND_PROFILES}
-                (brand_org_id, objective_primary, spend_per_event_min, spend_per_event_max,
-                 geographic_focus_type, campaign_start, campaign_end, default_match_weight_set_id, default_match_rule_set_id)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (brand_org_id) DO NOTHING
-            """, (brand_1_org_id, 'awareness', 75000, 200000, 'local', 
-                  '2025-01-01', '2025-12-31', 100, 100))
-            
-            # Add target cities (Mumbai, Pune)
-            for city_name in ["Mumbai", "Pune"]:
-                city_id = city_map.get(city_name)
-                if city_id:
-                    cur.execute(f"""
-                        INSERT INTO {CoreDB.BRAND_TARGET_CITIES} (brand_org_id, city_id, is_active)
-                        VALUES (%s, %s, %s)
-                        ON CONFLICT (brand_org_id, city_id) DO NOTHING
-                    """, (brand_1_org_id, city_id, True))
-            
-            # Add preferred categories (Technology, Business)
-            for cat_name in ["Technology", "Business"]:
-                cat_id = category_map.get(cat_name)
-                if cat_id:
-                    cur.execute(f"""
-                        INSERT INTO {CoreDB.BRAND_PREFERRED_CATEGORIES} 
-                        (brand_org_id, category_id, preference_type)
-                        VALUES (%s, %s, %s)
-                        ON CONFLICT (brand_org_id, category_id, preference_type) DO NOTHING
-                    """, (brand_1_org_id, cat_id, 'preferred'))
-            
-            # Add wanted deliverables
-            for deliv_name in ["Stage Branding", "Social Media Posts", "Speaking Slot"]:
-                deliv_id = deliverable_map.get(deliv_name)
-                if deliv_id:
-                    cur.execute(f"""
-                        INSERT INTO {CoreDB.BRAND_DELIVERABLE_PREFERENCES}
-                        (brand_org_id, deliverable_type_id, preference_type)
-                        VALUES (%s, %s, %s)
-                        ON CONFLICT (brand_org_id, deliverable_type_id, preference_type) DO NOTHING
-                    """, (brand_1_org_id, deliv_id, 'wanted'))
-            
-            # Add target age buckets
-            for age_label in ["25-34", "35-44"]:
-                age_id = age_bucket_map.get(age_label)
-                if age_id:
-                    cur.execute(f"""
-                        INSERT INTO {CoreDB.BRAND_TARGET_AGE_BUCKETS} (brand_org_id, age_bucket_id)
-                        VALUES (%s, %s)
-                        ON CONFLICT (brand_org_id, age_bucket_id) DO NOTHING
-                    """, (brand_1_org_id, age_id))
-            
-            # Add target audience types
-            for aud_type in ["B2B", "Professionals"]:
-                aud_id = audience_type_map.get(aud_type)
-                if aud_id:
-                    cur.execute(f"""
-                        INSERT INTO {CoreDB.BRAND_TARGET_AUDIENCE_TYPES} (brand_org_id, audience_type_id)
-                        VALUES (%s, %s)
-                        ON CONFLICT (brand_org_id, audience_type_id) DO NOTHING
-                    """, (brand_1_org_id, aud_id))
-            
-            # Add target interest tags
-            for tag_name in ["Technology", "Innovation", "AI & Machine Learning"]:
-                tag_id = interest_tag_map.get(tag_name)
-                if tag_id:
-                    cur.execute(f"""
-                        INSERT INTO {CoreDB.BRAND_TARGET_INTEREST_TAGS} (brand_org_id, interest_tag_id)
-                        VALUES (%s, %s)
-                        ON CONFLICT (brand_org_id, interest_tag_id) DO NOTHING
-                    """, (brand_1_org_id, tag_id))
-            
-            # ================================================================
-            # BRAND 2: MusicCo California (STATE - California)
-            # ================================================================
-            
-            cur.execute(f"""
-                INSERT INTO {CoreDB.ORGS} (org_id, org_type, org_name, is_active)
-                OVERRIDING SYSTEM VALUE
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (org_id) DO NOTHING
-            """, (brand_2_org_id, 'brand', 'MusicCo California', True))
-            
-            cur.execute(f"""
-                INSERT INTO {CoreDB.BRAND_PROFILES}
-                (brand_org_id, objective_primary, spend_per_event_min, spend_per_event_max,
-                 geographic_focus_type, campaign_start, campaign_end, default_match_weight_set_id, default_match_rule_set_id)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (brand_org_id) DO NOTHING
-            """, (brand_2_org_id, 'awareness', 25000, 100000, 'state',
-                  '2025-06-01', '2025-08-31', 101, 101))
-            
-            # Add target states (California)
-            california_state_id = state_map.get("California")
-            if california_state_id:
-                cur.execute(f"""
-                    INSERT INTO {CoreDB.BRAND_TARGET_STATES} (brand_org_id, state_id, is_active)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT (brand_org_id, state_id) DO NOTHING
-                """, (brand_2_org_id, california_state_id, True))
-            
-            # Add preferred categories
-            for cat_name in ["Music", "Entertainment", "Cultural"]:
-                cat_id = category_map.get(cat_name)
-                if cat_id:
-                    cur.execute(f"""
-                        INSERT INTO {CoreDB.BRAND_PREFERRED_CATEGORIES}
-                        (brand_org_id, category_id, preference_type)
-                        VALUES (%s, %s, %s)
-                        ON CONFLICT (brand_org_id, category_id, preference_type) DO NOTHING
-                    """, (brand_2_org_id, cat_id, 'preferred'))
-            
-            # Add wanted deliverables
-            for deliv_name in ["Social Media Posts", "Event App Branding"]:
-                deliv_id = deliverable_map.get(deliv_name)
-                if deliv_id:
-                    cur.execute(f"""
-                        INSERT INTO {CoreDB.BRAND_DELIVERABLE_PREFERENCES}
-                        (brand_org_id, deliverable_type_id, preference_type)
-                        VALUES (%s, %s, %s)
-                        ON CONFLICT (brand_org_id, deliverable_type_id, preference_type) DO NOTHING
-                    """, (brand_2_org_id, deliv_id, 'wanted'))
-            
-            # ================================================================
-            # BRAND 3: GlobalBrand USA (NATIONAL - United States)
-            # ================================================================
-            
-            cur.execute(f"""
-                INSERT INTO {CoreDB.ORGS} (org_id, org_type, org_name, is_active)
-                OVERRIDING SYSTEM VALUE
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (org_id) DO NOTHING
-            """, (brand_3_org_id, 'brand', 'GlobalBrand USA', True))
-            
-            cur.execute(f"""
-                INSERT INTO {CoreDB.BRAND_PROFILES}
-                (brand_org_id, objective_primary, spend_per_event_min, spend_per_event_max,
-                 geographic_focus_type, campaign_start, campaign_end, default_match_weight_set_id, default_match_rule_set_id)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (brand_org_id) DO NOTHING
-            """, (brand_3_org_id, 'awareness', 50000, 250000, 'national',
-                  '2025-03-01', '2025-11-30', 102, 102))
-            
-            # Add target countries (United States)
-            us_country_id = country_map.get("United States")
-            if us_country_id:
-                cur.execute(f"""
-                    INSERT INTO {CoreDB.BRAND_TARGET_COUNTRIES} (brand_org_id, country_id, is_active)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT (brand_org_id, country_id) DO NOTHING
-                """, (brand_3_org_id, us_country_id, True))
-            
-            # Add preferred categories
-            for cat_name in ["Technology", "Business"]:
-                cat_id = category_map.get(cat_name)
-                if cat_id:
-                    cur.execute(f"""
-                        INSERT INTO {CoreDB.BRAND_PREFERRED_CATEGORIES}
-                        (brand_org_id, category_id, preference_type)
-                        VALUES (%s, %s, %s)
-                        ON CONFLICT (brand_org_id, category_id, preference_type) DO NOTHING
-                    """, (brand_3_org_id, cat_id, 'preferred'))
-            
-            # Add must-have deliverables (strict requirement)
-            for deliv_name in ["Stage Branding", "Social Media Posts"]:
-                deliv_id = deliverable_map.get(deliv_name)
-                if deliv_id:
-                    cur.execute(f"""
-                        INSERT INTO {CoreDB.BRAND_DELIVERABLE_PREFERENCES}
-                        (brand_org_id, deliverable_type_id, preference_type)
-                        VALUES (%s, %s, %s)
-                        ON CONFLICT (brand_org_id, deliverable_type_id, preference_type) DO NOTHING
-                    """, (brand_3_org_id, deliv_id, 'must_have'))
-            
-            # ================================================================
-            # BRAND 4: LocalChicago (LOCAL - Chicago area)
-            # ================================================================
-            
-            cur.execute(f"""
-                INSERT INTO {CoreDB.ORGS} (org_id, org_type, org_name, is_active)
-                OVERRIDING SYSTEM VALUE
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (org_id) DO NOTHING
-            """, (brand_4_org_id, 'brand', 'LocalChicago Community Fund', True))
-            
-            cur.execute(f"""
-                INSERT INTO {CoreDB.BRAND_PROFILES}
-                (brand_org_id, objective_primary, spend_per_event_min, spend_per_event_max,
-                 geographic_focus_type, campaign_start, campaign_end, default_match_weight_set_id, default_match_rule_set_id)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (brand_org_id) DO NOTHING
-            """, (brand_4_org_id, 'awareness', 5000, 25000, 'local',
-                  None, None, 103, 103))
-            
-            # Add target cities (Chicago, Evanston, Aurora)
-            for city_name in ["Chicago", "Evanston", "Aurora"]:
-                city_id = city_map.get(city_name)
-                if city_id:
-                    cur.execute(f"""
-                        INSERT INTO {CoreDB.BRAND_TARGET_CITIES} (brand_org_id, city_id, is_active)
-                        VALUES (%s, %s, %s)
-                        ON CONFLICT (brand_org_id, city_id) DO NOTHING
-                    """, (brand_4_org_id, city_id, True))
-            
-            # Add preferred categories
-            for cat_name in ["Community", "Cultural"]:
-                cat_id = category_map.get(cat_name)
-                if cat_id:
-                    cur.execute(f"""
-                        INSERT INTO {CoreDB.BRAND_PREFERRED_CATEGORIES}
-                        (brand_org_id, category_id, preference_type)
-                        VALUES (%s, %s, %s)
-                        ON CONFLICT (brand_org_id, category_id, preference_type) DO NOTHING
-                    """, (brand_4_org_id, cat_id, 'preferred'))
-            
-            conn.commit()
+    # Reference names not found in configdb, reported once per field
+    missing_names: Dict[str, List[str]] = {}
     
-    brand_ids = [brand_1_org_id, brand_2_org_id, brand_3_org_id, brand_4_org_id]
+    for brand_data in brands_to_create:
+        brand_org_id = brand_data['org_id']
+        
+        org_rows.append((brand_org_id, 'brand', brand_data['org_name'], True))
+        profile_rows.append((
+            brand_org_id, brand_data['objective_primary'],
+            brand_data['spend_per_event_min'], brand_data['spend_per_event_max'],
+            brand_data['geographic_focus_type'], brand_data['campaign_start'], brand_data['campaign_end'],
+            brand_data['match_weight_set_id'], brand_data['match_rule_set_id'],
+        ))
+        
+        # Collect preference rows (names resolved via configdb maps)
+        for field, ref_map, rows, extra in preference_specs:
+            for name in brand_data.get(field, []):
+                ref_id = ref_map.get(name)
+                if ref_id:
+                    rows.append((brand_org_id, ref_id) + extra)
+                else:
+                    missing_names.setdefault(field, []).append(name)
+    
+    for field, names in missing_names.items():
+        print(f"⚠️ Unresolved {field} in brand seed (skipped): {', '.join(names)}")
+    
+    # ================================================================
+    # BATCHED INSERTS (one executemany per table; parents first)
+    # ================================================================
+    
+    cur.executemany(INSERT_ORG_SQL, org_rows)
+    cur.executemany(INSERT_BRAND_PROFILE_SQL, profile_rows)
+    cur.executemany(INSERT_BRAND_TARGET_CITY_SQL, target_city_rows)
+    cur.executemany(INSERT_BRAND_TARGET_STATE_SQL, target_state_rows)
+    cur.executemany(INSERT_BRAND_TARGET_COUNTRY_SQL, target_country_rows)
+    cur.executemany(INSERT_BRAND_CATEGORY_SQL, category_rows)
+    cur.executemany(INSERT_BRAND_DELIVERABLE_SQL, deliverable_rows)
+    cur.executemany(INSERT_BRAND_AGE_BUCKET_SQL, age_bucket_rows)
+    cur.executemany(INSERT_BRAND_AUDIENCE_TYPE_SQL, audience_type_rows)
+    cur.executemany(INSERT_BRAND_INTEREST_TAG_SQL, interest_tag_rows)
+    
+    brand_ids = [brand_data['org_id'] for brand_data in brands_to_create]
     print(f"✅ Seeded {len(brand_ids)} sample brands")
     return brand_ids
 
@@ -860,12 +806,59 @@ def seed_sample_brands(city_map: Dict[str, int], state_map: Dict[str, int],
 # SECTION 3: COREDB SAMPLE DATA - EVENTS
 # ============================================================================
 
-def seed_sample_events(city_map: Dict[str, int], event_type_map: Dict[str, int],
+# Event orgs use INSERT_ORG_SQL (Section 2).
+
+INSERT_EVENT_PROFILE_SQL = f"""
+    INSERT INTO {CoreDB.EVENT_PROFILES}
+    (event_org_id, event_name, event_type_id, city_id, start_date, end_date, expected_audience_size)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (event_org_id) DO NOTHING
+"""
+
+INSERT_EVENT_INVENTORY_SQL = f"""
+    INSERT INTO {CoreDB.EVENT_SPONSORSHIP_INVENTORY} (event_org_id, package_min, package_max)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (event_org_id) DO NOTHING
+"""
+
+INSERT_EVENT_CATEGORY_SQL = f"""
+    INSERT INTO {CoreDB.EVENT_CATEGORIES_MAP} (event_org_id, category_id)
+    VALUES (%s, %s)
+    ON CONFLICT (event_org_id, category_id) DO NOTHING
+"""
+
+INSERT_EVENT_DELIVERABLE_SQL = f"""
+    INSERT INTO {CoreDB.EVENT_DELIVERABLES_INVENTORY}
+    (event_org_id, deliverable_type_id, max_count)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (event_org_id, deliverable_type_id) DO NOTHING
+"""
+
+INSERT_EVENT_AGE_DISTRIBUTION_SQL = f"""
+    INSERT INTO {CoreDB.EVENT_AGE_DISTRIBUTION} (event_org_id, age_bucket_id, percent)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (event_org_id, age_bucket_id) DO NOTHING
+"""
+
+INSERT_EVENT_AUDIENCE_TYPE_SQL = f"""
+    INSERT INTO {CoreDB.EVENT_AUDIENCE_TYPES_MAP} (event_org_id, audience_type_id, weight)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (event_org_id, audience_type_id) DO NOTHING
+"""
+
+INSERT_EVENT_INTEREST_TAG_SQL = f"""
+    INSERT INTO {CoreDB.EVENT_INTEREST_TAGS_MAP} (event_org_id, interest_tag_id, weight)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (event_org_id, interest_tag_id) DO NOTHING
+"""
+
+
+def seed_sample_events(cur, city_map: Dict[str, int], event_type_map: Dict[str, int],
                        category_map: Dict[str, int], deliverable_map: Dict[str, int],
                        age_bucket_map: Dict[str, int], audience_type_map: Dict[str, int],
                        interest_tag_map: Dict[str, int]) -> List[int]:
     """
-    Seed sample event organizations with profiles and details.
+    Seed sample event organizations with profiles and details (caller commits).
     
     Returns: List of event_org_ids created
     """
@@ -877,8 +870,8 @@ def seed_sample_events(city_map: Dict[str, int], event_type_map: Dict[str, int],
             'event_name': 'Mumbai Tech Summit 2025',
             'city_name': 'Mumbai',
             'event_type': 'Tech Conference',
-            'start_date': '2025-06-15',
-            'end_date': '2025-06-17',
+            'start_date': date(2025, 6, 15),
+            'end_date': date(2025, 6, 17),
             'expected_audience_size': 5000,
             'package_min': 100000,
             'package_max': 200000,
@@ -894,8 +887,8 @@ def seed_sample_events(city_map: Dict[str, int], event_type_map: Dict[str, int],
             'event_name': 'Surat Expo 2025',
             'city_name': 'Surat',
             'event_type': 'Startup Event',
-            'start_date': '2025-04-10',
-            'end_date': '2025-04-12',
+            'start_date': date(2025, 4, 10),
+            'end_date': date(2025, 4, 12),
             'expected_audience_size': 3000,
             'package_min': 60000,
             'package_max': 150000,
@@ -911,8 +904,8 @@ def seed_sample_events(city_map: Dict[str, int], event_type_map: Dict[str, int],
             'event_name': 'Gurgaon Summer Music Fest',
             'city_name': 'Gurgaon',
             'event_type': 'Music Festival',
-            'start_date': '2025-07-20',
-            'end_date': '2025-07-22',
+            'start_date': date(2025, 7, 20),
+            'end_date': date(2025, 7, 22),
             'expected_audience_size': 15000,
             'package_min': 40000,
             'package_max': 120000,
@@ -928,8 +921,8 @@ def seed_sample_events(city_map: Dict[str, int], event_type_map: Dict[str, int],
             'event_name': 'Chennai Community Health Fair',
             'city_name': 'Chennai',
             'event_type': 'Community Event',
-            'start_date': '2025-09-10',
-            'end_date': '2025-09-10',
+            'start_date': date(2025, 9, 10),
+            'end_date': date(2025, 9, 10),
             'expected_audience_size': 800,
             'package_min': 8000,
             'package_max': 20000,
@@ -945,8 +938,8 @@ def seed_sample_events(city_map: Dict[str, int], event_type_map: Dict[str, int],
             'event_name': 'Ghaziabad AI Summit 2025',
             'city_name': 'Ghaziabad',
             'event_type': 'Tech Conference',
-            'start_date': '2025-05-05',
-            'end_date': '2025-05-07',
+            'start_date': date(2025, 5, 5),
+            'end_date': date(2025, 5, 7),
             'expected_audience_size': 4000,
             'package_min': 80000,
             'package_max': 200000,
@@ -960,106 +953,85 @@ def seed_sample_events(city_map: Dict[str, int], event_type_map: Dict[str, int],
     
     event_org_ids = []
     
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            for event_data in events_to_create:
-                org_id = event_data['org_id']
-                
-                # Create org
-                cur.execute(f"""
-                    INSERT INTO {CoreDB.ORGS} (org_id, org_type, org_name, is_active)
-                    OVERRIDING SYSTEM VALUE
-                    VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (org_id) DO NOTHING
-                    RETURNING org_id
-                """, (org_id, 'event', event_data['org_name'], True))
-                
-                result = cur.fetchone()
-                if not result:
-                    # Already exists, fetch it
-                    cur.execute(f"SELECT org_id FROM {CoreDB.ORGS} WHERE org_id = %s", (org_id,))
-                    result = cur.fetchone()
-                
-                event_org_id = result['org_id']
-                event_org_ids.append(event_org_id)
-                
-                # Get city_id
-                city_id = city_map.get(event_data['city_name'])
-                if not city_id:
-                    print(f"⚠️ City '{event_data['city_name']}' not found for event '{event_data['event_name']}'")
-                    continue
-                
-                # Get event_type_id
-                event_type_id = event_type_map.get(event_data['event_type'])
-                
-                # Create event profile
-                cur.execute(f"""
-                    INSERT INTO {CoreDB.EVENT_PROFILES}
-                    (event_org_id, event_name, event_type_id, city_id, start_date, end_date, expected_audience_size)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (event_org_id) DO NOTHING
-                """, (event_org_id, event_data['event_name'], event_type_id, city_id,
-                      event_data['start_date'], event_data['end_date'], event_data['expected_audience_size']))
-                
-                # Add categories
-                for cat_name in event_data.get('categories', []):
-                    cat_id = category_map.get(cat_name)
-                    if cat_id:
-                        cur.execute(f"""
-                            INSERT INTO {CoreDB.EVENT_CATEGORIES_MAP} (event_org_id, category_id)
-                            VALUES (%s, %s)
-                            ON CONFLICT (event_org_id, category_id) DO NOTHING
-                        """, (event_org_id, cat_id))
-                
-                # Add sponsorship inventory
-                cur.execute(f"""
-                    INSERT INTO {CoreDB.EVENT_SPONSORSHIP_INVENTORY} (event_org_id, package_min, package_max)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT (event_org_id) DO NOTHING
-                """, (event_org_id, event_data['package_min'], event_data['package_max']))
-                
-                # Add deliverables inventory
-                for deliv_name, max_count in event_data.get('deliverables', []):
-                    deliv_id = deliverable_map.get(deliv_name)
-                    if deliv_id:
-                        cur.execute(f"""
-                            INSERT INTO {CoreDB.EVENT_DELIVERABLES_INVENTORY}
-                            (event_org_id, deliverable_type_id, max_count)
-                            VALUES (%s, %s, %s)
-                            ON CONFLICT (event_org_id, deliverable_type_id) DO NOTHING
-                        """, (event_org_id, deliv_id, max_count))
-                
-                # Add age distribution
-                for age_label, percent in event_data.get('age_buckets', []):
-                    age_id = age_bucket_map.get(age_label)
-                    if age_id:
-                        cur.execute(f"""
-                            INSERT INTO {CoreDB.EVENT_AGE_DISTRIBUTION} (event_org_id, age_bucket_id, percent)
-                            VALUES (%s, %s, %s)
-                            ON CONFLICT (event_org_id, age_bucket_id) DO NOTHING
-                        """, (event_org_id, age_id, percent))
-                
-                # Add audience types
-                for aud_type, weight in event_data.get('audience_types', []):
-                    aud_id = audience_type_map.get(aud_type)
-                    if aud_id:
-                        cur.execute(f"""
-                            INSERT INTO {CoreDB.EVENT_AUDIENCE_TYPES_MAP} (event_org_id, audience_type_id, weight)
-                            VALUES (%s, %s, %s)
-                            ON CONFLICT (event_org_id, audience_type_id) DO NOTHING
-                        """, (event_org_id, aud_id, weight))
-                
-                # Add interest tags
-                for tag_name, weight in event_data.get('interest_tags', []):
-                    tag_id = interest_tag_map.get(tag_name)
-                    if tag_id:
-                        cur.execute(f"""
-                            INSERT INTO {CoreDB.EVENT_INTEREST_TAGS_MAP} (event_org_id, interest_tag_id, weight)
-                            VALUES (%s, %s, %s)
-                            ON CONFLICT (event_org_id, interest_tag_id) DO NOTHING
-                        """, (event_org_id, tag_id, weight))
-            
-            conn.commit()
+    # Rows are collected across all events, then written with one executemany
+    # per table (pipelined by psycopg) instead of one INSERT each.
+    org_rows: List[Tuple] = []
+    profile_rows: List[Tuple] = []
+    inventory_rows: List[Tuple] = []
+    category_rows: List[Tuple] = []
+    deliverable_rows: List[Tuple] = []
+    age_distribution_rows: List[Tuple] = []
+    audience_type_rows: List[Tuple] = []
+    interest_tag_rows: List[Tuple] = []
+    
+    # (event field, reference map, target rows, entries are (name, value) pairs)
+    detail_specs = [
+        ('categories', category_map, category_rows, False),
+        ('deliverables', deliverable_map, deliverable_rows, True),  # value: max_count
+        ('age_buckets', age_bucket_map, age_distribution_rows, True),  # value: percent
+        ('audience_types', audience_type_map, audience_type_rows, True),  # value: weight
+        ('interest_tags', interest_tag_map, interest_tag_rows, True),  # value: weight
+    ]
+    
+    # Reference names not found in configdb, reported once per field
+    missing_names: Dict[str, List[str]] = {}
+    # Warnings are printed together after the loop
+    seed_warnings: List[str] = []
+    
+    for event_data in events_to_create:
+        # Org ids are explicit (OVERRIDING SYSTEM VALUE), so a new or
+        # already existing org has the id given here
+        event_org_id = event_data['org_id']
+        org_rows.append((event_org_id, 'event', event_data['org_name'], True))
+        event_org_ids.append(event_org_id)
+        
+        # Get city_id
+        city_id = city_map.get(event_data['city_name'])
+        if not city_id:
+            seed_warnings.append(f"⚠️ City '{event_data['city_name']}' not found for event '{event_data['event_name']}'")
+            continue
+        
+        # Get event_type_id
+        event_type_id = event_type_map.get(event_data['event_type'])
+        
+        # Event profile
+        profile_rows.append((
+            event_org_id, event_data['event_name'], event_type_id, city_id,
+            event_data['start_date'], event_data['end_date'], event_data['expected_audience_size'],
+        ))
+        
+        # Sponsorship inventory
+        inventory_rows.append((event_org_id, event_data['package_min'], event_data['package_max']))
+        
+        # Collect detail rows (names resolved via configdb maps)
+        for field, ref_map, rows, paired in detail_specs:
+            for entry in event_data.get(field, []):
+                name, values = (entry[0], entry[1:]) if paired else (entry, ())
+                ref_id = ref_map.get(name)
+                if ref_id:
+                    rows.append((event_org_id, ref_id) + values)
+                else:
+                    missing_names.setdefault(field, []).append(name)
+    
+    seed_warnings.extend(
+        f"⚠️ Unresolved {field} in event seed (skipped): {', '.join(names)}"
+        for field, names in missing_names.items()
+    )
+    if seed_warnings:
+        print("\n".join(seed_warnings))
+    
+    # ================================================================
+    # BATCHED INSERTS (one executemany per table; parents first)
+    # ================================================================
+    
+    cur.executemany(INSERT_ORG_SQL, org_rows)
+    cur.executemany(INSERT_EVENT_PROFILE_SQL, profile_rows)
+    cur.executemany(INSERT_EVENT_INVENTORY_SQL, inventory_rows)
+    cur.executemany(INSERT_EVENT_CATEGORY_SQL, category_rows)
+    cur.executemany(INSERT_EVENT_DELIVERABLE_SQL, deliverable_rows)
+    cur.executemany(INSERT_EVENT_AGE_DISTRIBUTION_SQL, age_distribution_rows)
+    cur.executemany(INSERT_EVENT_AUDIENCE_TYPE_SQL, audience_type_rows)
+    cur.executemany(INSERT_EVENT_INTEREST_TAG_SQL, interest_tag_rows)
     
     print(f"✅ Seeded {len(event_org_ids)} sample events")
     return event_org_ids
@@ -1078,6 +1050,8 @@ def seed_database_postgres():
     2. Seed ConfigDB match_weight_sets and match_rule_sets only (if missing).
     3. Seed CoreDB: sample brands (orgs → profiles → preferences), then events.
     
+    All steps share one connection and commit once.
+    
     ConfigDB reference data (countries, states, cities, types, etc.) must already exist.
     """
     print("=" * 80)
@@ -1085,39 +1059,45 @@ def seed_database_postgres():
     print("=" * 80)
     
     try:
-        # Test connection first
         with get_connection() as conn:
             with conn.cursor() as cur:
+                # Test connection first
                 cur.execute("SELECT current_database()")
                 db_name = cur.fetchone()['current_database']
                 print(f"📊 Connected to database: {db_name}")
+                
+                print("\n🌍 Loading ConfigDB reference data (read-only)...")
+                print("-" * 80)
+                (
+                    country_map, state_map, city_map, event_type_map, category_map,
+                    deliverable_map, age_bucket_map, audience_type_map, interest_tag_map,
+                ) = load_configdb_reference_maps(cur)
+                
+                print("\n⚙️ Seeding ConfigDB: match weight sets & rule sets only...")
+                print("-" * 80)
+                weight_set_map = seed_match_weight_sets(cur)
+                rule_set_map = seed_match_rule_sets(cur)
+                
+                print("\n👥 Seeding CoreDB sample data...")
+                print("-" * 80)
+                
+                # Seed brands (depend on reference data from configdb)
+                brand_ids = seed_sample_brands(
+                    cur, city_map, state_map, country_map, category_map, deliverable_map,
+                    age_bucket_map, audience_type_map, interest_tag_map, weight_set_map, rule_set_map
+                )
+                
+                # Seed events (depend on reference data from configdb)
+                event_ids = seed_sample_events(
+                    cur, city_map, event_type_map, category_map, deliverable_map,
+                    age_bucket_map, audience_type_map, interest_tag_map
+                )
+                
+                conn.commit()
         
-        print("\n🌍 Loading ConfigDB reference data (read-only)...")
-        print("-" * 80)
-        (
-            country_map, state_map, city_map, event_type_map, category_map,
-            deliverable_map, age_bucket_map, audience_type_map, interest_tag_map,
-        ) = load_configdb_reference_maps()
-        
-        print("\n⚙️ Seeding ConfigDB: match weight sets & rule sets only...")
-        print("-" * 80)
-        weight_set_map = seed_match_weight_sets()
-        rule_set_map = seed_match_rule_sets()
-        
-        print("\n👥 Seeding CoreDB sample data...")
-        print("-" * 80)
-        
-        # Seed brands (depend on reference data from configdb)
-        brand_ids = seed_sample_brands(
-            city_map, state_map, country_map, category_map, deliverable_map,
-            age_bucket_map, audience_type_map, interest_tag_map, weight_set_map, rule_set_map
-        )
-        
-        # Seed events (depend on reference data from configdb)
-        event_ids = seed_sample_events(
-            city_map, event_type_map, category_map, deliverable_map,
-            age_bucket_map, audience_type_map, interest_tag_map
-        )
+        if USE_PROFILE_VIEWS:
+            print("\n🔄 Refreshing profile materialized views...")
+            refresh_profile_views()
         
         print("\n" + "=" * 80)
         print("✅ Database seeding completed successfully!")
@@ -1148,50 +1128,51 @@ def seed_database_postgres():
 # ============================================================================
 
 def verify_seeding():
-    """Verify that seeding was successful."""
+    """Verify that seeding was successful (all checks on one connection)."""
     print("\n🔍 Verifying seeded data...")
     print("-" * 80)
     
+    # (label, table, filter); all counted in one UNION ALL query
     checks = [
-        (f"SELECT COUNT(*) as cnt FROM {ConfigDB.COUNTRIES}", "Countries"),
-        (f"SELECT COUNT(*) as cnt FROM {ConfigDB.STATES}", "States"),
-        (f"SELECT COUNT(*) as cnt FROM {ConfigDB.CITIES}", "Cities"),
-        (f"SELECT COUNT(*) as cnt FROM {ConfigDB.EVENT_TYPES}", "Event Types"),
-        (f"SELECT COUNT(*) as cnt FROM {ConfigDB.EVENT_CATEGORIES}", "Event Categories"),
-        (f"SELECT COUNT(*) as cnt FROM {CoreDB.ORGS} WHERE org_type = 'brand'", "Brands"),
-        (f"SELECT COUNT(*) as cnt FROM {CoreDB.ORGS} WHERE org_type = 'event'", "Events"),
-        (f"SELECT COUNT(*) as cnt FROM {CoreDB.BRAND_PROFILES}", "Brand Profiles"),
-        (f"SELECT COUNT(*) as cnt FROM {CoreDB.EVENT_PROFILES}", "Event Profiles"),
+        ("Countries", ConfigDB.COUNTRIES, ""),
+        ("States", ConfigDB.STATES, ""),
+        ("Cities", ConfigDB.CITIES, ""),
+        ("Event Types", ConfigDB.EVENT_TYPES, ""),
+        ("Event Categories", ConfigDB.EVENT_CATEGORIES, ""),
+        ("Brands", CoreDB.ORGS, "WHERE org_type = 'brand'"),
+        ("Events", CoreDB.ORGS, "WHERE org_type = 'event'"),
+        ("Brand Profiles", CoreDB.BRAND_PROFILES, ""),
+        ("Event Profiles", CoreDB.EVENT_PROFILES, ""),
+        # Geographic hierarchy: cities missing state_id or country_id
+        ("Incomplete Cities", ConfigDB.CITIES, "WHERE state_id IS NULL OR country_id IS NULL"),
     ]
+    count_query = " UNION ALL ".join(
+        f"SELECT {check_no} AS check_no, COUNT(*) AS cnt FROM {table} {where}"
+        for check_no, (_, table, where) in enumerate(checks)
+    )
     
+    # Tuple rows: every check is positional, no per-row dicts needed
     with get_connection() as conn:
-        with conn.cursor() as cur:
-            for query, label in checks:
-                cur.execute(query)
-                count = cur.fetchone()['cnt']
+        with conn.cursor(row_factory=tuple_row) as cur:
+            cur.execute(count_query)
+            counts = dict(cur.fetchall())
+            
+            for check_no, (label, _, _) in enumerate(checks[:-1]):
+                count = counts[check_no]
                 status = "✅" if count > 0 else "❌"
                 print(f"{status} {label}: {count}")
-    
-    # Check geographic hierarchy
-    print("\n🌍 Checking geographic hierarchy...")
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(f"""
-                SELECT COUNT(*) as cnt 
-                FROM {ConfigDB.CITIES} 
-                WHERE state_id IS NULL OR country_id IS NULL
-            """)
-            incomplete = cur.fetchone()['cnt']
+            
+            # Check geographic hierarchy
+            print("\n🌍 Checking geographic hierarchy...")
+            incomplete = counts[len(checks) - 1]
             
             if incomplete == 0:
                 print(f"✅ All cities have complete geographic hierarchy")
             else:
                 print(f"⚠️ {incomplete} cities missing state_id or country_id")
-    
-    # Check brand geographic preferences
-    print("\n👥 Checking brand geographic preferences...")
-    with get_connection() as conn:
-        with conn.cursor() as cur:
+            
+            # Check brand geographic preferences
+            print("\n👥 Checking brand geographic preferences...")
             cur.execute(f"""
                 SELECT 
                     bp.geographic_focus_type,
@@ -1207,13 +1188,7 @@ def verify_seeding():
                 ORDER BY bp.geographic_focus_type
             """)
             
-            for row in cur.fetchall():
-                focus = row['geographic_focus_type']
-                brand_count = row['brand_count']
-                cities = row['brands_with_cities']
-                states = row['brands_with_states']
-                countries = row['brands_with_countries']
-                
+            for focus, brand_count, cities, states, countries in cur.fetchall():
                 print(f"   {focus}: {brand_count} brands (cities:{cities}, states:{states}, countries:{countries})")
 
 
@@ -1252,11 +1227,17 @@ def clear_sample_data():
                 CoreDB.ORGS,
             ]
             
+            # Per-table DELETE, not TRUNCATE: TRUNCATE rejects the whole
+            # statement if any table outside this list (deals, reports, ...)
+            # has a foreign key into one of these, even when it is empty.
             for table in tables_to_clear:
                 cur.execute(f"DELETE FROM {table}")
             
             conn.commit()
     
+    if USE_PROFILE_VIEWS:
+        refresh_profile_views()
+    
     print("✅ Coredb sample data cleared")
 
 
@@ -0,0 +1,55 @@
+-- ============================================================================
+-- BarterNow matchmaking read-path indexes
+--
+-- Run AFTER sql/matchmaking_schema_review.sql. Uses CREATE INDEX CONCURRENTLY,
+-- so execute outside a transaction block (e.g. psql -f, not inside BEGIN).
+--
+-- Already covered by existing UNIQUE constraints (leading column is the org id,
+-- see ON CONFLICT targets in app/seed_data_postgres.py), so NOT repeated here:
+--   brand_target_cities(brand_org_id, city_id)
+--   brand_target_states(brand_org_id, state_id)
+--   brand_target_countries(brand_org_id, country_id)
+--   brand_target_age_buckets(brand_org_id, age_bucket_id)
+--   brand_target_audience_types(brand_org_id, audience_type_id)
+--   brand_target_interest_tags(brand_org_id, interest_tag_id)
+--   brand_preferred_categories(brand_org_id, category_id, preference_type)
+--   brand_deliverable_preferences(brand_org_id, deliverable_type_id, preference_type)
+--   event_categories_map(event_org_id, category_id)
+--   event_deliverables_inventory(event_org_id, deliverable_type_id)
+--   event_age_distribution(event_org_id, age_bucket_id)
+--   event_audience_types_map(event_org_id, audience_type_id)
+--   event_interest_tags_map(event_org_id, interest_tag_id)
+--   event_sponsorship_inventory(event_org_id)
+-- ============================================================================
+
+-- Brand geographic targets: profile loads read only active rows.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS brand_target_cities_active_idx
+    ON barternow_coredb.brand_target_cities (brand_org_id, city_id)
+    WHERE is_active = true;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS brand_target_states_active_idx
+    ON barternow_coredb.brand_target_states (brand_org_id, state_id)
+    WHERE is_active = true;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS brand_target_countries_active_idx
+    ON barternow_coredb.brand_target_countries (brand_org_id, country_id)
+    WHERE is_active = true;
+
+-- Active org lists by type (batch matching id lists + API dropdowns).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS orgs_type_active_idx
+    ON barternow_coredb.orgs (org_type, org_id)
+    INCLUDE (org_name)
+    WHERE is_active = true;
+
+-- Event candidate filtering by geography (get_all_event_orgs with a brand's
+-- hard filters): city → events, and state → active cities.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS event_profiles_city_idx
+    ON barternow_coredb.event_profiles (city_id)
+    INCLUDE (event_org_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS cities_state_active_idx
+    ON barternow_configdb.cities (state_id, city_id)
+    WHERE is_active = true;
+
+-- match_weight_sets / match_rule_sets: primary-key lookups, and results are
+-- cached in-process (MATCH_CONFIG_TTL_SECONDS), so no extra index.